@@ -134,6 +134,7 @@ def evaluate(
     logger = setup_logger(verbose)
     suite = Suite(WORKFOLDER, QUERIES, logger)
     tools = experiment["tools"]
+    sorted_tools = sorted(tools.items())
     by_tool = defaultdict(list)
 
     with open(WORKFOLDER / "CITATION.cff") as f:
@@ -158,7 +159,7 @@ def evaluate(
             continue
 
         for n, (tool_name, tool) in itertools.product(
-            range(iterations), random.sample(sorted(tools.items()), k=len(tools))
+            range(iterations), random.sample(sorted_tools, k=len(sorted_tools))
         ):
             if filter_tools and not filter_tools.search(tool_name):
                 logger.trace(f"{tool_name} did not match {filter_tools}")
@@ -1,5 +1,6 @@
 import collections
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from io import StringIO
 from pathlib import Path
 from typing import TextIO, TypeVar
@@ -24,6 +25,9 @@ QUERIES = [
     "out of bounds",
 ]
 
+CASE_RE = re.compile(r"([^ ]*) +(\([^)]*\)) -> (.*)")
+PROBABILITY_RE = re.compile(r"([^%]*)\%")
+
 
 def re_parser(ctx_, parms_, expr):
     import re
@@ -82,15 +86,20 @@ class Input:
     val: tuple[JvmType, ...]
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def parse(string: str) -> "Input":
-        parsed_args = InputParser(string).parse_inputs()
+        parsed_args = InputParser.parse(string)
         input = Input(tuple(parsed_args))
         assert string == str(input), f"{input} should formatted as {string}"
         return input
 
-    def __str__(self) -> str:
+    @cached_property
+    def _str(self) -> str:
         return self.print(StringIO()).getvalue()
 
+    def __str__(self) -> str:
+        return self._str
+
     def print(self, file: W = sys.stdout) -> W:
         open, close = "()"
         file.write(open)
@@ -200,13 +209,17 @@ class Case:
 
     @staticmethod
     def from_spec(line):
-        if not (m := re.match(r"([^ ]*) +(\([^)]*\)) -> (.*)", line)):
+        if not (m := CASE_RE.match(line)):
             raise ValueError(f"Unexpected line: {line!r}")
         return Case(MethodId.parse(m.group(1)), Input.parse(m.group(2)), m.group(3))
 
-    def __str__(self) -> str:
+    @cached_property
+    def _str(self) -> str:
         return f"{self.methodid.class_name}.{self.methodid.method_name}:{self.input} -> {self.result}"
 
+    def __str__(self) -> str:
+        return self._str
+
     @staticmethod
     def by_methodid(iterable) -> list[tuple[MethodId, list["Case"]]]:
         cases_by_id = collections.defaultdict(list)
@@ -223,7 +236,7 @@ class Prediction:
 
     @staticmethod
     def parse(string: str) -> "Prediction":
-        if m := re.match(r"([^%]*)\%", string):
+        if m := PROBABILITY_RE.match(string):
             p = float(m.group(1)) / 100
             return Prediction.from_probability(p)
         else:
@@ -324,10 +337,9 @@ class Suite:
         self.logger.info("Done")
 
     def cases(self):
-        with open(self.stats_folder() / "cases.txt", "r") as f:
-            for r in f.readlines():
-                r = r.strip()
-                yield Case.from_spec(r)
+        text = (self.stats_folder() / "cases.txt").read_text()
+        for r in text.splitlines():
+            yield Case.from_spec(r.strip())
 
     def check(self):
         self.logger.info("Checking cases")
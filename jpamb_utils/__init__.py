@@ -1,6 +1,6 @@
 from typing import NoReturn, TypeAlias, Literal, Optional
 from dataclasses import dataclass
-from collections import namedtuple
+from functools import cached_property, lru_cache
 from pathlib import Path
 import re
 import sys
@@ -14,11 +14,30 @@ JvmType: TypeAlias = (
     | Literal["int[]"]
 )
 
+_TYPE_LOOKUP: dict[str, JvmType] = {
+    "Z": "boolean",
+    "I": "int",
+    "C": "char",
+    "[I": "int[]",
+    "[C": "char[]",
+}
 
+_INV_TYPE_LOOKUP: dict[JvmType, str] = {v: k for k, v in _TYPE_LOOKUP.items()}
+
+
+_PARAM_RE = re.compile(r"\[*[^[]")  # ]
+
+
+@lru_cache(maxsize=8192)
 def parse_params(input_type: str) -> tuple[JvmType]:
+    descriptors = _PARAM_RE.findall(input_type)
+    if sum(map(len, descriptors)) != len(input_type):
+        raise ValueError(f"Unknown type {input_type}")
+
     params = []
-    while input_type:
-        (tt, input_type) = parse_type(input_type)
+    for descriptor in descriptors:
+        if (tt := _TYPE_LOOKUP.get(descriptor)) is None:
+            raise ValueError(f"Unknown type {descriptor}")
         params.append(tt)
 
     return tuple(params)
@@ -29,14 +48,7 @@ def print_params(params: tuple[JvmType]) -> str:
 
 
 def print_type(tpe: JvmType) -> str:
-    INV_TYPE_LOOKUP: dict[JvmType, str] = {
-        "boolean": "Z",
-        "int": "I",
-        "char": "C",
-        "int[]": "[I",  # ]
-        "char[]": "[C",  # ]
-    }
-    return INV_TYPE_LOOKUP[tpe]
+    return _INV_TYPE_LOOKUP[tpe]
 
 
 def print_return_type(tpe: Optional[JvmType]) -> str:
@@ -50,6 +62,8 @@ def parse_return_type(input_type: str) -> Optional[JvmType]:
     assert input_type
     if input_type == "V":
         return None
+    if (tt := _TYPE_LOOKUP.get(input_type)) is not None:
+        return tt
     (tt, input_type) = parse_type(input_type)
     if input_type:
         raise ValueError(f"More than one return type {input_type}")
@@ -58,28 +72,26 @@ def parse_return_type(input_type: str) -> Optional[JvmType]:
 
 def parse_type(input_type: str) -> tuple[JvmType, str]:
     assert input_type
-    TYPE_LOOKUP: dict[str, JvmType] = {
-        "Z": "boolean",
-        "I": "int",
-        "C": "char",
-        "[I": "int[]",
-        "[C": "char[]",
-    }
-
-    if input_type[0] in TYPE_LOOKUP:
-        return (TYPE_LOOKUP[input_type[0]], input_type[1:])
-    elif input_type[0] == "[":  # ]
-        return (TYPE_LOOKUP[input_type[:2]], input_type[2:])
-    else:
+    depth = len(input_type) - len(input_type.lstrip("["))  # ]
+
+    if (tt := _TYPE_LOOKUP.get(input_type[: depth + 1])) is None:
         raise ValueError(f"Unknown type {input_type}")
+    return (tt, input_type[depth + 1 :])
 
 
 def string_compare(cls):
-    from functools import total_ordering
-
+    # The printed form doubles as the comparison key, so compute it only once.
+    cls._str = cached_property(cls.__str__)
+    cls._str.__set_name__(cls, "_str")
+    cls.__str__ = lambda self: self._str
     cls.__eq__ = lambda self, other: str(self) == str(other)
-    cls.__le__ = lambda self, other: str(self) < str(other)
-    return total_ordering(cls)
+    cls.__ne__ = lambda self, other: str(self) != str(other)
+    cls.__lt__ = lambda self, other: str(self) < str(other)
+    cls.__le__ = lambda self, other: str(self) <= str(other)
+    cls.__gt__ = lambda self, other: str(self) > str(other)
+    cls.__ge__ = lambda self, other: str(self) >= str(other)
+    cls.__hash__ = lambda self: hash(str(self))
+    return cls
 
 
 @dataclass(frozen=True)
@@ -91,7 +103,7 @@ class BoolValue:
         return "true" if self.value else "false"
 
     def tolocal(self):
-        return IntValue(1) if self.value else IntValue(0)
+        return _ONE if self.value else _ZERO
 
 
 @dataclass(frozen=True)
@@ -106,6 +118,9 @@ class IntValue:
         return self.value
 
 
+_ZERO, _ONE = IntValue(0), IntValue(1)
+
+
 @dataclass(frozen=True)
 @string_compare
 class CharValue:
@@ -124,7 +139,7 @@ class IntListValue:
     value: tuple[int]
 
     def __str__(self) -> str:
-        val = ", ".join(str(a) for a in self.value)
+        val = ", ".join(map(str, self.value))
         return f"[I:{val}]"
 
     def tolocal(self):
@@ -137,7 +152,7 @@ class CharListValue:
     value: tuple[str]
 
     def __str__(self) -> str:
-        val = ", ".join(str(a) for a in self.value)
+        val = ", ".join(map(str, self.value))
         return f"[C:{val}]"
 
     def tolocal(self):
@@ -155,36 +170,47 @@ class MethodId:
     return_type: Optional[JvmType]
 
     @classmethod
+    @lru_cache(maxsize=4096)
     def parse(cls, name):
-        import re
-
-        RE = (
-            r"(?P<class_name>.+)\.(?P<method_name>.*)\:\((?P<params>.*)\)(?P<return>.*)"
-        )
-        if (i := re.match(RE, name)) is None:
-            raise ValueError("invalid method name: %r", name)
+        head, open_, rest = name.partition(":(")
+        params, close, return_type = rest.rpartition(")")
+        class_name, dot, method_name = head.rpartition(".")
+        if not (open_ and close and dot and class_name):
+            raise ValueError(f"invalid method name: {name!r}")
 
         methodid = cls(
-            class_name=i["class_name"],
-            method_name=i["method_name"],
-            params=parse_params(i["params"]),
-            return_type=parse_return_type(i["return"]),
+            class_name=sys.intern(class_name),
+            method_name=sys.intern(method_name),
+            params=parse_params(params),
+            return_type=parse_return_type(return_type),
         )
 
         assert str(methodid) == name, f"Expected {methodid} == {name}"
 
         return methodid
 
-    def __str__(self) -> str:
+    @cached_property
+    def _str(self) -> str:
         pp = print_params(self.params)
         pr = print_return_type(self.return_type)
         return f"{self.class_name}.{self.method_name}:{pp}{pr}"
 
+    def __str__(self) -> str:
+        return self._str
+
+    @cached_property
+    def _class_parts(self) -> tuple[str, ...]:
+        return tuple(self.class_name.split("."))
+
+    @cached_property
+    def simple_class_name(self) -> str:
+        return self._class_parts[-1]
+
     def classfile(self):
-        return Path("decompiled", *self.class_name.split(".")).with_suffix(".json")
+        return Path("decompiled", *self._class_parts).with_suffix(".json")
 
     def sourcefile(self):
-        return Path("src/main/java", *self.class_name.split(".")).with_suffix(".java")
+        return Path("src/main/java", *self._class_parts).with_suffix(".java")
 
     def load(self):
         import json
@@ -214,132 +240,221 @@ class MethodId:
             raise ValueError(f"Could not find method {self.method_name}")
 
 
-@dataclass
+# Token kinds are small ints, so the parser checks them with a single compare.
+_KIND_NAMES = (
+    "OPEN_ARRAY",
+    "CLOSE_ARRAY",
+    "OPEN_INPUTS",
+    "CLOSE_INPUTS",
+    "INT",
+    "BOOL",
+    "CHAR",
+    "COMMA",
+)
+(
+    _OPEN_ARRAY,
+    _CLOSE_ARRAY,
+    _OPEN_INPUTS,
+    _CLOSE_INPUTS,
+    _INT,
+    _BOOL,
+    _CHAR,
+    _COMMA,
+) = range(len(_KIND_NAMES))
+
+_PUNCTUATION = {
+    "]": _CLOSE_ARRAY,
+    "(": _OPEN_INPUTS,
+    ")": _CLOSE_INPUTS,
+    ",": _COMMA,
+}
+_DIGITS = frozenset("0123456789")
+_INT_RE = re.compile(r"-?[0-9]+")
+_SKIP_CHARS = frozenset(" \t")
+_ARRAY_OPENERS = frozenset(["[I:", "[C:"])  # ]]
+
+
+_BOOL_VALUES = {"true": BoolValue(True), "false": BoolValue(False)}
+
+
+@lru_cache(maxsize=1024)
+def _int_value(token: str) -> IntValue:
+    return IntValue(int(token))
+
+
+@lru_cache(maxsize=1024)
+def _char_value(token: str) -> CharValue:
+    return CharValue(token[1])
+
+
+def _parse_scalars(string: str) -> Optional[list[JvmValue]]:
+    # Fast path for inputs without arrays; None defers to the full parser.
+    if not (string.startswith("(") and string.endswith(")")):
+        return None
+    inner = string[1:-1]
+    if not inner.strip(" \t"):
+        return []
+
+    values = []
+    for token in inner.split(","):
+        token = token.strip(" \t")
+        if (value := _BOOL_VALUES.get(token)) is None:
+            if _INT_RE.fullmatch(token) is None:
+                return None
+            value = _int_value(token)
+        values.append(value)
+    return values
+
+
+@dataclass(slots=True)
 class InputParser:
-    Token = namedtuple("Token", "kind value")
+    Token = tuple[int, str]
 
     tokens: list["InputParser.Token"]
     input: str
+    position: int
+    head: Optional["InputParser.Token"]
 
     def __init__(self, input) -> None:
         self.input = input
         self.tokens = list(InputParser.tokenize(input))
+        self.position = 0
+        self.head = self.tokens[0] if self.tokens else None
 
     @staticmethod
     def tokenize(string):
-        token_specification = [
-            ("OPEN_ARRAY", r"\[[IC]:"),
-            ("CLOSE_ARRAY", r"\]"),
-            ("OPEN_INPUTS", r"\("),
-            ("CLOSE_INPUTS", r"\)"),
-            ("INT", r"-?\d+"),
-            ("BOOL", r"true|false"),
-            ("CHAR", r"'[^']'"),
-            ("COMMA", r","),
-            ("SKIP", r"[ \t]+"),
-        ]
-        tok_regex = "|".join(f"(?P<{n}>{m})" for n, m in token_specification)
-
-        for m in re.finditer(tok_regex, string):
-            kind, value = m.lastgroup, m.group()
-            if kind == "SKIP":
+        i, n = 0, len(string)
+        while i < n:
+            c = string[i]
+            if c in _SKIP_CHARS:
+                i += 1
                 continue
-            yield InputParser.Token(kind, value)
+
+            if (kind := _PUNCTUATION.get(c)) is not None:
+                j = i + 1
+            elif c in _DIGITS or c == "-":
+                if (m := _INT_RE.match(string, i)) is None:
+                    raise ValueError(f"Expected digits after '-' at {i} in {string}")
+                kind, j = _INT, m.end()
+            elif c == "[":  # ]
+                kind, j = _OPEN_ARRAY, i + 3
+                if string[i:j] not in _ARRAY_OPENERS:
+                    raise ValueError(f"Unknown array type at {i} in {string}")
+            elif c == "'":
+                kind, j = _CHAR, i + 3
+                if j > n or string[i + 1] == "'" or string[j - 1] != "'":
+                    raise ValueError(f"Malformed char at {i} in {string}")
+            elif string.startswith("true", i):
+                kind, j = _BOOL, i + 4
+            elif string.startswith("false", i):
+                kind, j = _BOOL, i + 5
+            else:
+                raise ValueError(f"Unexpected {c!r} at {i} in {string}")
+
+            yield (kind, string[i:j])
+            i = j
 
     @staticmethod
     def parse(string) -> list[JvmValue]:
+        if "[" not in string and (values := _parse_scalars(string)) is not None:  # ]
+            return values
         return InputParser(string).parse_inputs()
 
-    @property
-    def head(self):
-        if self.tokens:
-            return self.tokens[0]
-
     def next(self):
-        self.tokens = self.tokens[1:]
+        self.position += 1
+        if self.position < len(self.tokens):
+            self.head = self.tokens[self.position]
+        else:
+            self.head = None
+
+    def seek(self, position):
+        self.position = position
+        if position < len(self.tokens):
+            self.head = self.tokens[position]
+        else:
+            self.head = None
 
     def expected(self, expected) -> NoReturn:
-        raise ValueError(
-            f"Expected {expected} but got {self.tokens[:3]} in {self.input}"
-        )
+        upcoming = [
+            (_KIND_NAMES[kind], value)
+            for kind, value in self.tokens[self.position : self.position + 3]
+        ]
+        raise ValueError(f"Expected {expected} but got {upcoming} in {self.input}")
 
     def expect(self, expect) -> Token:
         head = self.head
-        if head is None:
-            self.expected(repr(expect))
-        elif expect != head.kind:
-            self.expected(repr(expect))
+        if head is None or head[0] != expect:
+            self.expected(repr(_KIND_NAMES[expect]))
         self.next()
         return head
 
     def parse_input(self):
         next = self.head or self.expected("token")
-        if next.kind == "INT":
-            return self.parse_int()
-        if next.kind == "OPEN_ARRAY":
-            return self.parse_array()
-        if next.kind == "BOOL":
-            return self.parse_bool()
-        self.expected("input")
+        if (parser := _INPUT_PARSERS.get(next[0])) is None:
+            self.expected("input")
+        return parser(self)
 
     def parse_int(self):
-        tok = self.expect("INT")
-        return IntValue(int(tok.value))
+        return _int_value(self.expect(_INT)[1])
 
     def parse_bool(self):
-        tok = self.expect("BOOL")
-        return BoolValue(tok.value == "true")
+        return _BOOL_VALUES[self.expect(_BOOL)[1]]
 
     def parse_char(self):
-        tok = self.expect("CHAR")
-        return CharValue(tok.value[1])
+        return _char_value(self.expect(_CHAR)[1])
 
     def parse_array(self):
-        key = self.expect("OPEN_ARRAY")
-        if key.value == "[I:":  # ]
-            listtype = IntListValue
-            parser = self.parse_int
-        elif key.value == "[C:":  # ]
-            listtype = CharListValue
-            parser = self.parse_char
+        key = self.expect(_OPEN_ARRAY)
+        if key[1] == "[I:":  # ]
+            return IntListValue(self.parse_elements(_INT, _int_value))
+        elif key[1] == "[C:":  # ]
+            return CharListValue(self.parse_elements(_CHAR, _char_value))
         else:
             self.expected("int or char array")
 
-        inputs = []
-
-        if self.head is None:
-            self.expected("input or ]")
-
-        if self.head.kind == "CLOSE_ARRAY":
-            self.next()
-            return listtype(tuple())
+    def parse_elements(self, kind, convert) -> tuple:
+        # Walk the tokens with a local index; this is the hot loop for long arrays.
+        tokens, i, n = self.tokens, self.position, len(self.tokens)
+        elements = []
 
-        inputs.append(parser())
+        if i < n and tokens[i][0] == kind:
+            elements.append(convert(tokens[i][1]))
+            i += 1
+            while i + 1 < n and tokens[i][0] == _COMMA and tokens[i + 1][0] == kind:
+                elements.append(convert(tokens[i + 1][1]))
+                i += 2
 
-        while self.head and self.head.kind == "COMMA":
+        self.seek(i)
+        if elements and self.head is not None and self.head[0] == _COMMA:
             self.next()
-            inputs.append(parser())
+            self.expect(kind)
+        self.expect(_CLOSE_ARRAY)
 
-        self.expect("CLOSE_ARRAY")
-
-        return listtype(tuple(inputs))
+        return tuple(elements)
 
     def parse_inputs(self):
-        self.expect("OPEN_INPUTS")
+        self.expect(_OPEN_INPUTS)
         inputs = []
 
         if self.head is None:
             self.expected("input or )")
 
-        if self.head.kind == "CLOSE_INPUTS":
+        if self.head[0] == _CLOSE_INPUTS:
             return inputs
 
         inputs.append(self.parse_input())
 
-        while self.head and self.head.kind == "COMMA":
+        while self.head and self.head[0] == _COMMA:
             self.next()
             inputs.append(self.parse_input())
 
-        self.expect("CLOSE_INPUTS")
+        self.expect(_CLOSE_INPUTS)
 
         return inputs
+
+
+_INPUT_PARSERS = {
+    _INT: InputParser.parse_int,
+    _OPEN_ARRAY: InputParser.parse_array,
+    _BOOL: InputParser.parse_bool,
+}
@@ -22,7 +22,7 @@ with open(srcfile, "rb") as f:
     l.debug("parse sourcefile %s", srcfile)
     tree = parser.parse(f.read())
 
-simple_classname = method.class_name.split(".")[-1]
+simple_classname = method.simple_class_name
 
 # To figure out how to write these you can consult the
 # https://tree-sitter.github.io/tree-sitter/playground